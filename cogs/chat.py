@@ -4,8 +4,11 @@ Responds to @mentions and replies in any channel using Claude,
 with automatic GitHub activity context for dev-related questions.
 """
 
+import asyncio
 import collections
 import os
+import re
+import time
 from datetime import datetime, timezone, timedelta
 
 import aiohttp
@@ -14,8 +17,24 @@ import discord
 from discord.ext import commands
 from discord.ext.commands import Context
 
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+MANILA_TZ = ZoneInfo("Asia/Manila")
+
 REPO_NAME = "adhub"
 
+# Minimum seconds between edits of a reply while Claude is still streaming
+STREAM_EDIT_INTERVAL = 1.0
+
+# Cached GitHub responses are kept this long (seconds) for ETag revalidation
+GH_CACHE_MAX_AGE = 3600
+
+# Scheduled rebase hours in UTC+8 (see cogs/reminders.py)
+REBASE_HOURS = (0, 18)
+
 SYSTEM_PROMPT = """You are AdHub Bot, the official Discord assistant for the AdHub development team.
 
 PERSONALITY:
@@ -61,20 +80,167 @@ GITHUB_KEYWORDS = [
     "summarize", "summary", "recent", "today", "yesterday",
 ]
 
+# Keywords that only point at one kind of data; everything else also fetches commits
+ISSUE_ONLY_KEYWORDS = {"issues", "issue"}
+PR_ONLY_KEYWORDS = {"pull request", "pr ", "prs"}
+
+
+def _keyword_re(keywords) -> re.Pattern:
+    # Keywords match at the start of a word ("commit" also catches "committed");
+    # a trailing space in a keyword means it must also end on a word boundary.
+    return re.compile(
+        r"\b(?:"
+        + "|".join(
+            re.escape(kw.strip()) + (r"\b" if kw.endswith(" ") else "")
+            for kw in sorted(keywords, key=len, reverse=True)
+        )
+        + ")",
+        re.IGNORECASE,
+    )
+
+
+_GH_RE = _keyword_re(GITHUB_KEYWORDS)
+_COMMIT_RE = _keyword_re(
+    kw for kw in GITHUB_KEYWORDS if kw not in ISSUE_ONLY_KEYWORDS | PR_ONLY_KEYWORDS
+)
+_ISSUE_RE = re.compile(r"\b(?:issue|bug|ticket)", re.IGNORECASE)
+_PR_RE = re.compile(r"\b(?:prs?\b|pull request|review)", re.IGNORECASE)
+
+
+# One-line summaries of github_feed buffer records, by event type
+_FEED_FORMATTERS = {
+    "push": lambda e: (
+        f"[PUSH] {e.get('pusher', '?')} pushed {e.get('commit_count', 0)} "
+        f"commit(s) to {e.get('branch', '?')}: "
+        + ", ".join(c["message"] for c in e.get("commits", [])[:5])
+    ),
+    "pull_request": lambda e: (
+        f"[PR] #{e.get('pr_number', 0)} {e.get('pr_title', '')} "
+        f"- {e.get('action', '?')} by {e.get('sender', '?')}"
+    ),
+    "issues": lambda e: (
+        f"[ISSUE] #{e.get('issue_number', 0)} {e.get('issue_title', '')} "
+        f"- {e.get('action', '?')} by {e.get('sender', '?')}"
+    ),
+    "create": lambda e: f"[BRANCH CREATED] {e.get('ref', '?')} by {e.get('sender', '?')}",
+    "delete": lambda e: f"[BRANCH DELETED] {e.get('ref', '?')} by {e.get('sender', '?')}",
+    "release": lambda e: f"[RELEASE] {e.get('tag', '?')} - {e.get('action', '?')}",
+}
+
+
+async def gh_api(
+    session: aiohttp.ClientSession, path: str, params: dict, etag: str | None = None
+) -> tuple[int, dict, object]:
+    """GET /repos/{GITHUB_ORG}/{REPO_NAME}/{path}, conditionally on `etag` if given.
+
+    Returns (status, headers, JSON body). The body is None unless the status is 200
+    (a 304 means the caller's copy is still current); network or decode errors report status 0.
+    """
+    github_org = os.getenv("GITHUB_ORG")
+    try:
+        async with session.get(
+            f"https://api.github.com/repos/{github_org}/{REPO_NAME}/{path}",
+            params=params,
+            headers={"If-None-Match": etag} if etag else None,
+        ) as resp:
+            if resp.status != 200:
+                return resp.status, resp.headers, None
+            return resp.status, resp.headers, await resp.json()
+    except Exception:
+        return 0, {}, None
+
+
+def _format_commit(c: dict) -> str:
+    commit = c.get("commit") or {}
+    author = commit.get("author") or {}
+    msg = (commit.get("message") or "").split("\n", 1)[0]
+    return f"{c.get('sha', '')[:7]} {author.get('name', 'Unknown')}: {msg} ({author.get('date', '')})"
+
+
+def _format_commits(commits) -> str:
+    if not commits:
+        return ""
+    return "\n".join(_format_commit(c) for c in commits[:30])
+
+
+def _format_issues(issues) -> str:
+    if not issues:
+        return ""
+
+    lines = []
+    for i in issues:
+        # GitHub API returns PRs as issues too — skip them
+        if i.get("pull_request"):
+            continue
+        assignees = ", ".join(a["login"] for a in i.get("assignees", [])) or "unassigned"
+        labels = ", ".join(l["name"] for l in i.get("labels", []))
+        lines.append(
+            f"#{i['number']} {i['title']} (assignees: {assignees})"
+            + (f" [{labels}]" if labels else "")
+        )
+
+    return "\n".join(lines) if lines else ""
+
+
+def _format_prs(prs) -> str:
+    if not prs:
+        return ""
+
+    lines = []
+    for pr in prs:
+        user = pr.get("user", {}).get("login", "?")
+        lines.append(
+            f"#{pr['number']} {pr['title']} by {user} "
+            f"({pr.get('head', {}).get('ref', '?')} -> {pr.get('base', {}).get('ref', '?')})"
+        )
+
+    return "\n".join(lines)
+
 
 class Chat(commands.Cog, name="chat"):
     def __init__(self, bot) -> None:
         self.bot = bot
         self.client = None
-        self.channel_histories: dict[int, collections.deque] = {}
+        # Least recently used channel first; capped at MAX_CHANNELS
+        self.channel_histories: collections.OrderedDict[int, collections.deque] = collections.OrderedDict()
         self.MAX_HISTORY = 10
+        self.MAX_CHANNELS = 256
+        self._http = None
+        # (path, params) -> (fetched at, JSON body, ETag)
+        self._gh_cache: dict[tuple, tuple[float, object, str | None]] = {}
+        self._sys_cache: tuple[int, str] | None = None
+        # path -> (X-RateLimit-Remaining, X-RateLimit-Reset epoch seconds)
+        self._gh_rl: dict[str, tuple[int, int]] = {}
+        self._mention_re = None
+
+    async def cog_load(self) -> None:
+        # Extensions load in setup_hook, after login, so bot.user is set
+        self._mention_re = re.compile(rf"<@!?{self.bot.user.id}>")
+        self._http = aiohttp.ClientSession(
+            headers={
+                "Authorization": f"token {os.getenv('GITHUB_TOKEN')}",
+                "Accept": "application/vnd.github.v3+json",
+            },
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+
+    async def cog_unload(self) -> None:
+        if self._http is not None:
+            await self._http.close()
 
     # ── History management ─────────────────────────────────────────
 
     def _get_history(self, channel_id: int) -> collections.deque:
-        if channel_id not in self.channel_histories:
-            self.channel_histories[channel_id] = collections.deque(maxlen=self.MAX_HISTORY)
-        return self.channel_histories[channel_id]
+        history = self.channel_histories.get(channel_id)
+        if history is None:
+            if len(self.channel_histories) >= self.MAX_CHANNELS:
+                self.channel_histories.popitem(last=False)
+            history = collections.deque(maxlen=self.MAX_HISTORY)
+            self.channel_histories[channel_id] = history
+        else:
+            self.channel_histories.move_to_end(channel_id)
+        return history
 
     def _add_to_history(self, channel_id: int, role: str, content: str) -> None:
         history = self._get_history(channel_id)
@@ -87,8 +253,7 @@ class Chat(commands.Cog, name="chat"):
 
     @staticmethod
     def _is_github_question(content: str) -> bool:
-        lower = content.lower()
-        return any(kw in lower for kw in GITHUB_KEYWORDS)
+        return _GH_RE.search(content) is not None
 
     async def _get_github_feed_context(self) -> str:
         """Get buffered GitHub events from the github_feed cog (non-destructive)."""
@@ -100,174 +265,112 @@ class Chat(commands.Cog, name="chat"):
         if not events:
             return ""
 
-        lines = []
-        for e in events:
-            if e["type"] == "push":
-                commit_msgs = ", ".join(c["message"] for c in e.get("commits", [])[:5])
-                lines.append(
-                    f"[PUSH] {e.get('pusher', '?')} pushed {e.get('commit_count', 0)} "
-                    f"commit(s) to {e.get('branch', '?')}: {commit_msgs}"
-                )
-            elif e["type"] == "pull_request":
-                lines.append(
-                    f"[PR] #{e.get('pr_number', 0)} {e.get('pr_title', '')} "
-                    f"- {e.get('action', '?')} by {e.get('sender', '?')}"
-                )
-            elif e["type"] == "issues":
-                lines.append(
-                    f"[ISSUE] #{e.get('issue_number', 0)} {e.get('issue_title', '')} "
-                    f"- {e.get('action', '?')} by {e.get('sender', '?')}"
-                )
-            elif e["type"] == "create":
-                lines.append(f"[BRANCH CREATED] {e.get('ref', '?')} by {e.get('sender', '?')}")
-            elif e["type"] == "delete":
-                lines.append(f"[BRANCH DELETED] {e.get('ref', '?')} by {e.get('sender', '?')}")
-            elif e["type"] == "release":
-                lines.append(f"[RELEASE] {e.get('tag', '?')} - {e.get('action', '?')}")
+        formatted = (
+            _FEED_FORMATTERS[e["type"]](e) for e in events if e["type"] in _FEED_FORMATTERS
+        )
+        return "\n".join(formatted)
+
+    async def _gh_get(self, path: str, params: dict, ttl: int = 60, cache_key: tuple | None = None):
+        """GET a repo endpoint from the GitHub API, reusing responses younger than `ttl` seconds.
+
+        Older cached responses are revalidated with their ETag; a 304 doesn't count
+        against the rate limit. `cache_key` overrides the default (path, params) key for
+        requests whose params drift between calls (e.g. a rolling `since`). Returns the
+        decoded JSON body, or None if GitHub isn't configured or didn't answer with 200/304.
+        """
+        if not os.getenv("GITHUB_TOKEN") or not os.getenv("GITHUB_ORG"):
+            return None
+
+        key = cache_key or (path, tuple(sorted(params.items())))
+        cached = self._gh_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        # Don't spend a request GitHub is going to reject; serve stale data instead
+        remaining, reset = self._gh_rl.get(path, (None, 0))
+        if remaining is not None and remaining < 2 and time.time() < reset:
+            self.bot.logger.warning(
+                f"GitHub rate limit nearly exhausted for '{path}', skipping until {reset}"
+            )
+            return cached[1] if cached is not None else None
+
+        etag = cached[2] if cached is not None else None
+        status, headers, data = await gh_api(self._http, path, params, etag)
+        if "X-RateLimit-Remaining" in headers:
+            self._gh_rl[path] = (
+                int(headers["X-RateLimit-Remaining"]),
+                int(headers.get("X-RateLimit-Reset", "0")),
+            )
+        if status == 304 and cached is not None:
+            data = cached[1]
+        elif status == 200:
+            etag = headers.get("ETag")
+        else:
+            return None
 
-        return "\n".join(lines)
+        now = time.monotonic()
+        # Drop long-unused entries
+        for stale in [k for k, (ts, _, _) in self._gh_cache.items() if now - ts >= GH_CACHE_MAX_AGE]:
+            del self._gh_cache[stale]
+        self._gh_cache[key] = (now, data, etag)
+        return data
 
     async def _fetch_recent_commits(self, hours: int = 24) -> str:
         """Fetch recent commits from GitHub API."""
-        github_token = os.getenv("GITHUB_TOKEN")
-        github_org = os.getenv("GITHUB_ORG")
-        if not github_token or not github_org:
-            return ""
-
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
         cutoff_iso = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        headers = {
-            "Authorization": f"token {github_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
-        try:
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(
-                    f"https://api.github.com/repos/{github_org}/{REPO_NAME}/commits",
-                    params={"since": cutoff_iso, "per_page": 30},
-                ) as resp:
-                    if resp.status != 200:
-                        return ""
-                    commits = await resp.json()
-        except Exception:
-            return ""
-
-        if not commits:
-            return ""
-
-        lines = []
-        for c in commits:
-            author = c.get("commit", {}).get("author", {}).get("name", "Unknown")
-            msg = c.get("commit", {}).get("message", "").split("\n")[0]
-            sha = c.get("sha", "")[:7]
-            date = c.get("commit", {}).get("author", {}).get("date", "")
-            lines.append(f"{sha} {author}: {msg} ({date})")
-
-        return "\n".join(lines[:30])
+        # `since` moves every call, so key the cache (and its ETag) on the window instead;
+        # GitHub answers 304 whenever the window still holds the same commits
+        return _format_commits(
+            await self._gh_get(
+                "commits",
+                {"since": cutoff_iso, "per_page": 30},
+                cache_key=("commits", hours, 30),
+            )
+        )
 
     async def _fetch_github_issues(self) -> str:
         """Fetch open issues from GitHub API."""
-        github_token = os.getenv("GITHUB_TOKEN")
-        github_org = os.getenv("GITHUB_ORG")
-        if not github_token or not github_org:
-            return ""
-
-        headers = {
-            "Authorization": f"token {github_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
-        try:
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(
-                    f"https://api.github.com/repos/{github_org}/{REPO_NAME}/issues",
-                    params={"state": "open", "per_page": 15},
-                ) as resp:
-                    if resp.status != 200:
-                        return ""
-                    issues = await resp.json()
-        except Exception:
-            return ""
-
-        if not issues:
-            return ""
-
-        lines = []
-        for i in issues:
-            # GitHub API returns PRs as issues too — skip them
-            if i.get("pull_request"):
-                continue
-            assignees = ", ".join(a["login"] for a in i.get("assignees", [])) or "unassigned"
-            labels = ", ".join(l["name"] for l in i.get("labels", []))
-            lines.append(
-                f"#{i['number']} {i['title']} (assignees: {assignees})"
-                + (f" [{labels}]" if labels else "")
-            )
-
-        return "\n".join(lines) if lines else ""
+        return _format_issues(
+            await self._gh_get("issues", {"state": "open", "per_page": 15})
+        )
 
     async def _fetch_github_prs(self) -> str:
         """Fetch open pull requests from GitHub API."""
-        github_token = os.getenv("GITHUB_TOKEN")
-        github_org = os.getenv("GITHUB_ORG")
-        if not github_token or not github_org:
-            return ""
-
-        headers = {
-            "Authorization": f"token {github_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
-        try:
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(
-                    f"https://api.github.com/repos/{github_org}/{REPO_NAME}/pulls",
-                    params={"state": "open", "per_page": 15},
-                ) as resp:
-                    if resp.status != 200:
-                        return ""
-                    prs = await resp.json()
-        except Exception:
-            return ""
-
-        if not prs:
-            return ""
-
-        lines = []
-        for pr in prs:
-            user = pr.get("user", {}).get("login", "?")
-            lines.append(
-                f"#{pr['number']} {pr['title']} by {user} "
-                f"({pr.get('head', {}).get('ref', '?')} -> {pr.get('base', {}).get('ref', '?')})"
-            )
-
-        return "\n".join(lines)
+        return _format_prs(
+            await self._gh_get("pulls", {"state": "open", "per_page": 15})
+        )
 
     async def _build_github_context(self, content: str) -> str:
         """Combine GitHub data sources into a context block."""
-        parts = []
-
-        feed_data = await self._get_github_feed_context()
-        if feed_data:
-            parts.append(f"=== Recent GitHub Activity (from Discord feed) ===\n{feed_data}")
-
-        commit_data = await self._fetch_recent_commits(hours=24)
-        if commit_data:
-            parts.append(f"=== Recent Commits (last 24h from GitHub API) ===\n{commit_data}")
-
-        # Fetch issues/PRs if specifically asked
-        lower = content.lower()
-        if any(kw in lower for kw in ["issue", "issues", "bug", "bugs", "ticket"]):
-            issues_data = await self._fetch_github_issues()
-            if issues_data:
-                parts.append(f"=== Open GitHub Issues ===\n{issues_data}")
+        want_issues = _ISSUE_RE.search(content) is not None
+        want_prs = _PR_RE.search(content) is not None
+        # Questions scoped to issues/PRs only don't need the commits call
+        want_commits = _COMMIT_RE.search(content) is not None or not (want_issues or want_prs)
+
+        # The in-memory feed is free, so it's always included
+        sections = [
+            ("=== Recent GitHub Activity (from Discord feed) ===", self._get_github_feed_context()),
+        ]
+        if want_commits:
+            sections.append(
+                ("=== Recent Commits (last 24h from GitHub API) ===", self._fetch_recent_commits(hours=24))
+            )
+        if want_issues:
+            sections.append(("=== Open GitHub Issues ===", self._fetch_github_issues()))
+        if want_prs:
+            sections.append(("=== Open Pull Requests ===", self._fetch_github_prs()))
+
+        # Sources are independent, so wait on all of them at once
+        results = await asyncio.gather(
+            *(coro for _, coro in sections), return_exceptions=True
+        )
 
-        if any(kw in lower for kw in ["pr ", "prs", "pull request", "pull requests", "review"]):
-            prs_data = await self._fetch_github_prs()
-            if prs_data:
-                parts.append(f"=== Open Pull Requests ===\n{prs_data}")
+        parts = []
+        for (header, _), data in zip(sections, results):
+            if isinstance(data, BaseException) or not data:
+                continue
+            parts.append(f"{header}\n{data}")
 
         if not parts:
             return "\n[No recent GitHub activity data available.]"
@@ -276,35 +379,23 @@ class Chat(commands.Cog, name="chat"):
 
     # ── Claude API ─────────────────────────────────────────────────
 
-    async def _get_claude_response(self, channel_id: int, github_context: str = "") -> str:
-        anthropic_key = os.getenv("ANTHROPIC_API_KEY")
-        if not anthropic_key:
-            return "I need an `ANTHROPIC_API_KEY` to chat. Ask an admin to set it up!"
-
-        if self.client is None:
-            self.client = anthropic.AsyncAnthropic(api_key=anthropic_key)
-
-        # Inject current time so the bot has time awareness
-        try:
-            from zoneinfo import ZoneInfo
-        except ImportError:
-            from backports.zoneinfo import ZoneInfo
-
-        now_utc8 = datetime.now(ZoneInfo("Asia/Manila"))
+    def _get_system_prompt(self) -> str:
+        """Return SYSTEM_PROMPT with the current time block, rebuilt at most once a minute."""
         now_utc = datetime.now(timezone.utc)
+        bucket = int(now_utc.timestamp()) // 60
+        if self._sys_cache is not None and self._sys_cache[0] == bucket:
+            return self._sys_cache[1]
 
-        # Calculate next rebase time
-        rebase_hours = [0, 18]
-        next_rebase = None
-        for h in sorted(rebase_hours):
-            candidate = now_utc8.replace(hour=h, minute=0, second=0, microsecond=0)
-            if candidate > now_utc8:
-                next_rebase = candidate
-                break
-        if next_rebase is None:
-            # Next rebase is midnight tomorrow
-            tomorrow = now_utc8 + timedelta(days=1)
-            next_rebase = tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
+        # Inject current time so the bot has time awareness
+        now_utc8 = now_utc.astimezone(MANILA_TZ)
+
+        # Calculate next rebase time: seconds until the nearest upcoming slot,
+        # where a slot that is exactly now counts as a full day away
+        secs_now = now_utc8.hour * 3600 + now_utc8.minute * 60 + now_utc8.second
+        secs_ahead = min(((h * 3600 - secs_now) % 86400) or 86400 for h in REBASE_HOURS)
+        next_rebase = (now_utc8 + timedelta(seconds=secs_ahead)).replace(
+            minute=0, second=0, microsecond=0
+        )
 
         time_until = next_rebase - now_utc8
         hours_until, remainder = divmod(int(time_until.total_seconds()), 3600)
@@ -318,6 +409,25 @@ class Chat(commands.Cog, name="chat"):
         )
 
         system = SYSTEM_PROMPT + time_block
+        self._sys_cache = (bucket, system)
+        return system
+
+    async def _get_claude_response(
+        self, channel_id: int, github_context: str = "", on_update=None
+    ) -> str:
+        """Stream a reply from Claude.
+
+        :param on_update: Optional coroutine called with the text so far, at most
+            once every STREAM_EDIT_INTERVAL seconds while tokens arrive.
+        """
+        anthropic_key = os.getenv("ANTHROPIC_API_KEY")
+        if not anthropic_key:
+            return "I need an `ANTHROPIC_API_KEY` to chat. Ask an admin to set it up!"
+
+        if self.client is None:
+            self.client = anthropic.AsyncAnthropic(api_key=anthropic_key)
+
+        system = self._get_system_prompt()
         if github_context:
             system += f"\n\n[GITHUB ACTIVITY]\n{github_context}"
 
@@ -325,39 +435,63 @@ class Chat(commands.Cog, name="chat"):
         if not messages:
             return "Nothing to respond to... awkward."
 
-        response = await self.client.messages.create(
+        parts = []
+        last_update = time.monotonic()
+        async with self.client.messages.stream(
             model="claude-sonnet-4-5-20250929",
             max_tokens=1024,
             system=system,
             messages=messages,
-        )
-        return response.content[0].text
+        ) as stream:
+            async for text in stream.text_stream:
+                parts.append(text)
+                if on_update is not None and time.monotonic() - last_update >= STREAM_EDIT_INTERVAL:
+                    await on_update("".join(parts))
+                    last_update = time.monotonic()
+        reply = "".join(parts)
+        if not reply.strip():
+            # Discord rejects empty messages, so don't hand _send_response nothing
+            return "I came up blank on that one. Try rephrasing?"
+        return reply
 
     # ── Message splitting for Discord 2000-char limit ──────────────
 
     @staticmethod
     def _split_message(text: str, limit: int = 2000) -> list[str]:
+        # Walk a cursor through the original string instead of re-slicing the tail
         chunks = []
-        while len(text) > limit:
-            split_at = text.rfind("\n", 0, limit)
-            if split_at == -1:
-                split_at = limit
-            chunks.append(text[:split_at])
-            text = text[split_at:].lstrip("\n")
-        if text:
-            chunks.append(text)
+        i, n = 0, len(text)
+        while n - i > limit:
+            split_at = text.rfind("\n", i, i + limit)
+            if split_at <= i:
+                split_at = i + limit
+            chunks.append(text[i:split_at])
+            i = split_at
+            while i < n and text[i] == "\n":
+                i += 1
+        if i < n:
+            chunks.append(text[i:])
         return chunks
 
-    async def _send_response(self, message: discord.Message, response_text: str) -> None:
+    async def _send_response(
+        self,
+        message: discord.Message,
+        response_text: str,
+        preview: discord.Message | None = None,
+    ) -> None:
+        """Reply with the full response, finishing a streamed `preview` reply if there is one."""
         if len(response_text) <= 2000:
-            await message.reply(response_text, mention_author=False)
+            chunks = [response_text]
         else:
             chunks = self._split_message(response_text, 2000)
-            for i, chunk in enumerate(chunks):
-                if i == 0:
-                    await message.reply(chunk, mention_author=False)
+        for i, chunk in enumerate(chunks):
+            if i == 0:
+                if preview is not None:
+                    await preview.edit(content=chunk)
                 else:
-                    await message.channel.send(chunk)
+                    await message.reply(chunk, mention_author=False)
+            else:
+                await message.channel.send(chunk)
 
         self._add_to_history(message.channel.id, "assistant", response_text)
 
@@ -369,8 +503,12 @@ class Chat(commands.Cog, name="chat"):
         if message.author == self.bot.user or message.author.bot:
             return
 
-        # Only respond when @mentioned or replied to
-        bot_mentioned = self.bot.user.mentioned_in(message) and not message.mention_everyone
+        # Nothing to answer (attachments/stickers only)
+        if not message.content:
+            return
+
+        # Only respond when @mentioned or replied to; message.mentions is already parsed
+        bot_mentioned = not message.mention_everyone and self.bot.user in message.mentions
         is_reply_to_bot = (
             message.reference is not None
             and message.reference.resolved is not None
@@ -382,12 +520,7 @@ class Chat(commands.Cog, name="chat"):
 
         # Don't steal prefix commands
         prefix = os.getenv("PREFIX", "!")
-        clean = (
-            message.content
-            .replace(f"<@{self.bot.user.id}>", "")
-            .replace(f"<@!{self.bot.user.id}>", "")
-            .strip()
-        )
+        clean = self._mention_re.sub("", message.content).strip()
         if clean.startswith(prefix):
             return
 
@@ -399,11 +532,23 @@ class Chat(commands.Cog, name="chat"):
         if self._is_github_question(clean):
             github_context = await self._build_github_context(clean)
 
+        # Show the reply while it streams in, then finish it in _send_response
+        preview = None
+
+        async def show_partial(text: str) -> None:
+            nonlocal preview
+            if not text.strip():
+                return
+            if preview is None:
+                preview = await message.reply(text[:2000], mention_author=False)
+            elif len(text) <= 2000:
+                await preview.edit(content=text)
+
         # Call Claude with typing indicator
         async with message.channel.typing():
             try:
                 response_text = await self._get_claude_response(
-                    message.channel.id, github_context
+                    message.channel.id, github_context, on_update=show_partial
                 )
             except anthropic.APIError as e:
                 response_text = f"Claude API hiccup: `{e.message}`"
@@ -412,7 +557,7 @@ class Chat(commands.Cog, name="chat"):
                 response_text = "Something broke in my brain. Try again in a sec."
                 self.bot.logger.error(f"Chat cog error: {e}")
 
-        await self._send_response(message, response_text)
+        await self._send_response(message, response_text, preview)
 
     # ── Slash commands ─────────────────────────────────────────────
 
@@ -4,7 +4,10 @@ Fetches recent commits from the adhub repo and uses Claude (Anthropic API)
 to generate a human-readable standup-style summary.
 """
 
+import asyncio
+import hashlib
 import os
+import time
 from datetime import datetime, timezone, timedelta
 
 import aiohttp
@@ -15,10 +18,93 @@ from discord.ext.commands import Context
 
 REPO_NAME = "adhub"
 
+# Reuse a summary for identical commit sets within this window (seconds)
+SUMMARY_TTL = 600
+# Entries older than this are dropped whenever a new summary is stored
+SUMMARY_MAX_AGE = 3600
+
+
+def _commit_row(c: dict) -> tuple[str, str, str, str]:
+    """Pull (short sha, author, subject, date) out of a GitHub commit object."""
+    commit = c.get("commit") or {}
+    author = commit.get("author") or {}
+    message = (commit.get("message") or "").split("\n", 1)[0]
+    return c.get("sha", "")[:7], author.get("name", "Unknown"), message, author.get("date", "")
+
+
+def _format_commit_block(rows) -> str:
+    """Render (sha, author, message, date) rows as one line per commit."""
+    return "\n".join(f"{sha} {author}: {message} ({date})" for sha, author, message, date in rows)
+
 
 class CommitSummary(commands.Cog, name="commit_summary"):
     def __init__(self, bot) -> None:
         self.bot = bot
+        self._http = None
+        self._claude = None
+        self._summary_cache: dict[str, tuple[float, str]] = {}
+        # (branch, hours) -> (time stored, ETag, commits) for conditional re-fetches
+        self._commits_cache: dict[tuple, tuple[float, str, list]] = {}
+
+    async def cog_load(self) -> None:
+        self._http = aiohttp.ClientSession(
+            headers={
+                "Authorization": f"token {os.getenv('GITHUB_TOKEN')}",
+                "Accept": "application/vnd.github.v3+json",
+            },
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+
+    async def cog_unload(self) -> None:
+        if self._http is not None:
+            await self._http.close()
+        if self._claude is not None:
+            await self._claude.close()
+
+    def _store_summary(self, key: str, summary: str) -> None:
+        now = time.monotonic()
+        for stale in [k for k, (ts, _) in self._summary_cache.items() if now - ts >= SUMMARY_MAX_AGE]:
+            del self._summary_cache[stale]
+        self._summary_cache[key] = (now, summary)
+
+    async def _fetch_commits(self, github_org: str, branch: str | None, hours: int) -> list:
+        """Fetch commits from the last `hours` hours, raising with GitHub's message on failure.
+
+        The previous response for the same branch and window is revalidated with its ETag,
+        so an unchanged commit list comes back as a 304 that doesn't count against the rate limit.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+        cutoff_iso = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        params = {"since": cutoff_iso, "per_page": 100}
+        if branch:
+            params["sha"] = branch
+
+        key = (branch, hours)
+        cached = self._commits_cache.get(key)
+        async with self._http.get(
+            f"https://api.github.com/repos/{github_org}/{REPO_NAME}/commits",
+            params=params,
+            headers={"If-None-Match": cached[1]} if cached is not None else None,
+        ) as resp:
+            if resp.status == 304 and cached is not None:
+                commits = cached[2]
+            elif resp.status == 200:
+                commits = await resp.json()
+            else:
+                text = await resp.text()
+                raise Exception(f"GitHub API returned {resp.status}: {text[:200]}")
+            etag = resp.headers.get("ETag")
+
+        now = time.monotonic()
+        for stale in [k for k, (ts, _, _) in self._commits_cache.items() if now - ts >= SUMMARY_MAX_AGE]:
+            del self._commits_cache[stale]
+        if etag:
+            self._commits_cache[key] = (now, etag, commits)
+        else:
+            self._commits_cache.pop(key, None)
+        return commits
 
     @commands.hybrid_command(
         name="commit-summary",
@@ -54,32 +140,16 @@ class CommitSummary(commands.Cog, name="commit_summary"):
             await context.send(embed=embed, ephemeral=True)
             return
 
-        await context.defer()
-
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-        cutoff_iso = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        headers = {
-            "Authorization": f"token {github_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
+        # Start the GitHub request while the defer round-trip is in flight
+        fetch_task = asyncio.create_task(self._fetch_commits(github_org, branch, hours))
         try:
-            all_commits = []
-            async with aiohttp.ClientSession(headers=headers) as session:
-                params = {"since": cutoff_iso, "per_page": 100}
-                if branch:
-                    params["sha"] = branch
-
-                async with session.get(
-                    f"https://api.github.com/repos/{github_org}/{REPO_NAME}/commits",
-                    params=params,
-                ) as resp:
-                    if resp.status != 200:
-                        text = await resp.text()
-                        raise Exception(f"GitHub API returned {resp.status}: {text[:200]}")
-                    all_commits = await resp.json()
+            await context.defer()
+        except BaseException:
+            fetch_task.cancel()
+            raise
 
+        try:
+            all_commits = await fetch_task
         except Exception as e:
             embed = discord.Embed(
                 title="GitHub API Error",
@@ -103,44 +173,48 @@ class CommitSummary(commands.Cog, name="commit_summary"):
             await context.send(embed=embed)
             return
 
-        # ── Format commits for Claude ──
-        lines = []
-        for c in all_commits:
-            author = c.get("commit", {}).get("author", {}).get("name", "Unknown")
-            message = c.get("commit", {}).get("message", "").split("\n")[0]
-            sha = c.get("sha", "")[:7]
-            date = c.get("commit", {}).get("author", {}).get("date", "")
-            lines.append(f"{sha} {author}: {message} ({date})")
-
-        commit_block = "\n".join(lines[:300])
-
-        # ── Call Claude ──
-        try:
-            client = anthropic.AsyncAnthropic(api_key=anthropic_key)
-            response = await client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=1024,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": (
-                            f"Summarize these git commits from the '{REPO_NAME}' repo "
-                            f"{'on branch ' + branch if branch else '(all branches)'} "
-                            f"for a team standup. Group by contributor, highlight key changes, "
-                            f"keep it concise.\n\n{commit_block}"
-                        ),
-                    }
-                ],
-            )
-            summary = response.content[0].text
-        except Exception as e:
-            embed = discord.Embed(
-                title="Claude API Error",
-                description=f"Failed to generate summary: {e}",
-                color=0xE02B2B,
-            )
-            await context.send(embed=embed)
-            return
+        # ── Reuse a recent summary if the commit set hasn't changed ──
+        cache_key = hashlib.blake2b(
+            repr((branch, hours, tuple(c.get("sha", "") for c in all_commits))).encode(),
+            digest_size=16,
+        ).hexdigest()
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < SUMMARY_TTL:
+            summary = cached[1]
+        else:
+            # ── Format commits for Claude ──
+            commit_block = _format_commit_block(_commit_row(c) for c in all_commits[:300])
+
+            # ── Call Claude ──
+            try:
+                if self._claude is None:
+                    self._claude = anthropic.AsyncAnthropic(api_key=anthropic_key)
+                response = await self._claude.messages.create(
+                    model="claude-sonnet-4-5-20250929",
+                    max_tokens=1024,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": (
+                                f"Summarize these git commits from the '{REPO_NAME}' repo "
+                                f"{'on branch ' + branch if branch else '(all branches)'} "
+                                f"for a team standup. Group by contributor, highlight key changes, "
+                                f"keep it concise.\n\n{commit_block}"
+                            ),
+                        }
+                    ],
+                )
+                summary = response.content[0].text
+            except Exception as e:
+                embed = discord.Embed(
+                    title="Claude API Error",
+                    description=f"Failed to generate summary: {e}",
+                    color=0xE02B2B,
+                )
+                await context.send(embed=embed)
+                return
+
+            self._store_summary(cache_key, summary)
 
         # ── Send embed to the channel where command was called ──
         embed = discord.Embed(
@@ -7,20 +7,57 @@ reminder digest.
 
 import os
 import re
-from datetime import datetime, timedelta, timezone
+from collections import deque
+from collections.abc import Iterable
+from datetime import datetime, timezone
 from typing import Optional
 
 import discord
 from discord.ext import commands
 from discord.ext.commands import Context
 
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+TZ_UTC8 = ZoneInfo("Asia/Manila")
+
+# Oldest events are dropped past this point if no digest drains the buffer
+EVENT_BUFFER_MAX = 500
+
+# ── Title/description patterns of the Discord GitHub integration embeds ──
+# Push: "[repo:branch] N new commit(s)"
+_PUSH_RE = re.compile(r"\[(.+):(.+)\] (\d+) new commits?")
+# Commit line: [`sha`](url) message - author, or plain `sha` message
+_COMMIT_LINE_RE = re.compile(
+    r"(?:\[`([a-f0-9]+)`\]\(([^)]+)\)|`([a-f0-9]+)`)\s+(.+?)(?:\s+-\s+.+)?$"
+)
+_PR_RE = re.compile(r"\[(.+)\] Pull request #(\d+)\s+(.+?):\s+(.+)", re.IGNORECASE)
+# Simpler PR pattern: "[repo] Pull request opened: #N title"
+_PR_RE2 = re.compile(r"\[(.+)\] Pull request (\w+)\s*(?:#(\d+))?\s*(.*)", re.IGNORECASE)
+_ISSUE_RE = re.compile(r"\[(.+)\] Issue #(\d+)\s+(.+?):\s+(.+)", re.IGNORECASE)
+_ISSUE_RE2 = re.compile(r"\[(.+)\] Issue (\w+)\s*(?:#(\d+))?\s*(.*)", re.IGNORECASE)
+_CREATE_RE = re.compile(r"\[(.+)\] New (\w+) created: `?(.+?)`?$", re.IGNORECASE)
+_DELETE_RE = re.compile(r"\[(.+)\] (\w+) deleted: `?(.+?)`?$", re.IGNORECASE)
+_RELEASE_RE = re.compile(
+    r"\[(.+)\] (?:New )?[Rr]elease (.+?)(?:\s+(published|created|drafted))?$"
+)
+
 
 class GitHubFeed(commands.Cog, name="github_feed"):
     def __init__(self, bot) -> None:
         self.bot = bot
-        # Event buffer for rebase digest - list of dicts
-        self.event_buffer = []
+        # Event buffer for rebase digest - bounded deque of dicts
+        self.event_buffer: deque[dict] = deque(maxlen=EVENT_BUFFER_MAX)
+        # Bumped whenever the buffer changes so consumers can cache what they build from it
+        self.buffer_version = 0
         self._backfilled = False
+        channel_id = os.getenv("GITHUB_FEED_CHANNEL_ID")
+        self._channel_id: int | None = int(channel_id) if channel_id else None
+        # Optional allow-list of the GitHub integration's user IDs; any bot if unset
+        author_ids = os.getenv("GITHUB_FEED_AUTHOR_IDS", "")
+        self._author_ids = frozenset(int(a) for a in author_ids.split(",") if a.strip())
 
     @commands.Cog.listener("on_ready")
     async def on_ready_backfill(self) -> None:
@@ -30,24 +67,10 @@ class GitHubFeed(commands.Cog, name="github_feed"):
     @staticmethod
     def _last_rebase_time() -> datetime:
         """Calculate the most recent scheduled rebase time (12 AM or 6 PM UTC+8)."""
-        try:
-            from zoneinfo import ZoneInfo
-        except ImportError:
-            from backports.zoneinfo import ZoneInfo
-
-        tz = ZoneInfo("Asia/Manila")
-        now = datetime.now(tz)
-        # Rebase times in UTC+8: 00:00 (midnight), 18:00
-        rebase_hours = [0, 18]
-
-        for h in sorted(rebase_hours, reverse=True):
-            candidate = now.replace(hour=h, minute=0, second=0, microsecond=0)
-            if candidate <= now:
-                return candidate.astimezone(timezone.utc)
-
-        # Before midnight today — last rebase was 6 PM yesterday
-        yesterday = now - timedelta(days=1)
-        return yesterday.replace(hour=18, minute=0, second=0, microsecond=0).astimezone(timezone.utc)
+        now = datetime.now(TZ_UTC8)
+        # Rebase times in UTC+8: 00:00 (midnight), 18:00 — midnight has always passed today
+        hour = 18 if now.hour >= 18 else 0
+        return now.replace(hour=hour, minute=0, second=0, microsecond=0).astimezone(timezone.utc)
 
     async def _backfill(self) -> None:
         """Scan feed channel messages since last rebase and parse missed GitHub embeds."""
@@ -64,52 +87,57 @@ class GitHubFeed(commands.Cog, name="github_feed"):
         self.bot.logger.info(f"Backfilling GitHub events since {cutoff.isoformat()}")
 
         async for message in channel.history(after=cutoff, limit=200, oldest_first=True):
-            if not message.author.bot:
+            if not self._is_feed_author(message.author):
                 continue
             if not message.embeds:
                 continue
             for embed in message.embeds:
-                record = self._parse_github_embed(embed)
+                # Use the message timestamp instead of now
+                record = self._parse_github_embed(embed, message.created_at)
                 if record:
-                    # Use the message timestamp instead of now
-                    record["timestamp"] = message.created_at
-                    self.event_buffer.append(record)
+                    self.buffer_events((record,))
                     count += 1
 
         if count:
             self.bot.logger.info(f"Backfilled {count} GitHub events from channel history")
 
     def _get_channel(self):
-        channel_id = os.getenv("GITHUB_FEED_CHANNEL_ID")
-        if not channel_id:
+        if self._channel_id is None:
             return None
-        return self.bot.get_channel(int(channel_id))
-
-    def drain_buffer(self) -> list[dict]:
-        """Return all buffered events and clear the buffer."""
-        events = self.event_buffer.copy()
-        self.event_buffer.clear()
+        return self.bot.get_channel(self._channel_id)
+
+    def _is_feed_author(self, author: discord.abc.User) -> bool:
+        if self._author_ids:
+            return author.id in self._author_ids
+        return author.bot
+
+    def buffer_events(self, records: Iterable[dict]) -> None:
+        """Append records to the digest buffer."""
+        self.event_buffer.extend(records)
+        self.buffer_version += 1
+
+    def drain_buffer(self) -> deque[dict]:
+        """Hand over all buffered events and start a fresh buffer."""
+        events = self.event_buffer
+        self.event_buffer = deque(maxlen=EVENT_BUFFER_MAX)
+        self.buffer_version += 1
         return events
 
     def peek_buffer(self) -> list[dict]:
         """Return buffered events without clearing."""
-        return self.event_buffer.copy()
+        return list(self.event_buffer)
 
     # ── Listen for GitHub integration embeds ───────────────────────
 
     @commands.Cog.listener("on_message")
     async def on_github_embed(self, message: discord.Message) -> None:
         """Parse embeds posted by the Discord GitHub integration."""
-        channel_id = os.getenv("GITHUB_FEED_CHANNEL_ID")
-        if not channel_id:
-            return
-
         # Only listen in the feed channel
-        if message.channel.id != int(channel_id):
+        if self._channel_id is None or message.channel.id != self._channel_id:
             return
 
-        # Only process bot/webhook messages (GitHub integration posts as an app)
-        if not message.author.bot:
+        # Only process the GitHub integration (or any bot/webhook if no IDs are configured)
+        if not self._is_feed_author(message.author):
             return
 
         if not message.embeds:
@@ -118,52 +146,50 @@ class GitHubFeed(commands.Cog, name="github_feed"):
         for embed in message.embeds:
             record = self._parse_github_embed(embed)
             if record:
-                self.event_buffer.append(record)
+                self.buffer_events((record,))
                 self.bot.logger.info(
                     f"Buffered GitHub event: {record['type']} from {record.get('sender', 'unknown')}"
                 )
 
-    def _parse_github_embed(self, embed: discord.Embed) -> Optional[dict]:
-        """Parse a Discord GitHub integration embed into a buffer record."""
+    def _parse_github_embed(
+        self, embed: discord.Embed, now: Optional[datetime] = None
+    ) -> Optional[dict]:
+        """Parse a Discord GitHub integration embed into a buffer record stamped with `now`."""
         title = embed.title or ""
+        # Every integration title starts with "[repo...]"; skip other bots' embeds outright
+        if not title.startswith("["):
+            return None
+        if now is None:
+            now = datetime.now(timezone.utc)
+        # Each pattern below needs its keyword, so test that before running the regex
+        title_lower = title.lower()
         description = embed.description or ""
-        url = str(embed.url) if embed.url else ""
-        author_name = embed.author.name if embed.author else "unknown"
-        now = datetime.now(timezone.utc)
+        author_name = embed.author.name or "unknown"
 
         # ── Push: "[repo:branch] N new commit(s)" ──
-        push_match = re.match(r"\[(.+):(.+)\] (\d+) new commits?", title)
+        push_match = "new commit" in title and _PUSH_RE.match(title)
         if push_match:
             repo = push_match.group(1)
             branch = push_match.group(2)
             commit_count = int(push_match.group(3))
+            url = embed.url or ""
 
             # Parse commit lines from description: "`sha` message - author"
             commits = []
-            for line in description.strip().split("\n"):
-                line = line.strip()
-                if not line:
-                    continue
+            for line in description.splitlines():
                 # Format: [`sha`](url) message - author
                 # or simpler: `sha` message
-                commit_match = re.match(
-                    r"\[`([a-f0-9]+)`\]\(([^)]+)\)\s+(.+?)(?:\s+-\s+.+)?$", line
-                )
-                if commit_match:
-                    commits.append({
-                        "sha": commit_match.group(1),
-                        "url": commit_match.group(2),
-                        "message": commit_match.group(3).strip(),
-                    })
-                else:
-                    # Fallback: plain text commit line
-                    plain_match = re.match(r"`([a-f0-9]+)`\s+(.+?)(?:\s+-\s+.+)?$", line)
-                    if plain_match:
-                        commits.append({
-                            "sha": plain_match.group(1),
-                            "url": url,
-                            "message": plain_match.group(2).strip(),
-                        })
+                commit_match = _COMMIT_LINE_RE.match(line.strip())
+                if not commit_match:
+                    continue
+                commits.append({
+                    "sha": commit_match.group(1) or commit_match.group(3),
+                    "url": commit_match.group(2) or url,
+                    "message": commit_match.group(4).strip(),
+                })
+                # Only the first 15 commits are kept; don't parse the rest
+                if len(commits) >= 15:
+                    break
 
             return {
                 "type": "push",
@@ -173,14 +199,13 @@ class GitHubFeed(commands.Cog, name="github_feed"):
                 "branch": branch,
                 "pusher": author_name,
                 "commit_count": commit_count,
-                "commits": commits[:15],
+                "commits": commits,
                 "compare_url": url,
             }
 
         # ── Pull Request: title contains "pull request" ──
-        pr_match = re.match(
-            r"\[(.+)\] Pull request #(\d+)\s+(.+?):\s+(.+)", title, re.IGNORECASE
-        )
+        is_pr = "pull request" in title_lower
+        pr_match = is_pr and _PR_RE.match(title)
         if pr_match:
             return {
                 "type": "pull_request",
@@ -190,19 +215,17 @@ class GitHubFeed(commands.Cog, name="github_feed"):
                 "action": pr_match.group(3).strip().lower(),
                 "pr_number": int(pr_match.group(2)),
                 "pr_title": pr_match.group(4).strip(),
-                "pr_url": url,
+                "pr_url": embed.url or "",
                 "head": "",
                 "base": "",
-                "merged": "merged" in title.lower(),
+                "merged": "merged" in title_lower,
                 "additions": 0,
                 "deletions": 0,
                 "changed_files": 0,
             }
 
         # Simpler PR pattern: "[repo] Pull request opened: #N title"
-        pr_match2 = re.match(
-            r"\[(.+)\] Pull request (\w+)\s*(?:#(\d+))?\s*(.*)", title, re.IGNORECASE
-        )
+        pr_match2 = is_pr and _PR_RE2.match(title)
         if pr_match2:
             pr_num_str = pr_match2.group(3) or "0"
             return {
@@ -213,23 +236,20 @@ class GitHubFeed(commands.Cog, name="github_feed"):
                 "action": pr_match2.group(2).strip().lower(),
                 "pr_number": int(pr_num_str),
                 "pr_title": pr_match2.group(4).strip(),
-                "pr_url": url,
+                "pr_url": embed.url or "",
                 "head": "",
                 "base": "",
-                "merged": "merged" in title.lower(),
+                "merged": "merged" in title_lower,
                 "additions": 0,
                 "deletions": 0,
                 "changed_files": 0,
             }
 
         # ── Issue: title contains "Issue" ──
-        issue_match = re.match(
-            r"\[(.+)\] Issue #(\d+)\s+(.+?):\s+(.+)", title, re.IGNORECASE
-        )
-        if not issue_match:
-            issue_match = re.match(
-                r"\[(.+)\] Issue (\w+)\s*(?:#(\d+))?\s*(.*)", title, re.IGNORECASE
-            )
+        is_issue = "issue" in title_lower
+        issue_match = is_issue and _ISSUE_RE.match(title)
+        if is_issue and not issue_match:
+            issue_match = _ISSUE_RE2.match(title)
             if issue_match:
                 return {
                     "type": "issues",
@@ -239,7 +259,7 @@ class GitHubFeed(commands.Cog, name="github_feed"):
                     "action": issue_match.group(2).strip().lower(),
                     "issue_number": int(issue_match.group(3) or 0),
                     "issue_title": issue_match.group(4).strip(),
-                    "issue_url": url,
+                    "issue_url": embed.url or "",
                 }
         if issue_match:
             return {
@@ -250,13 +270,11 @@ class GitHubFeed(commands.Cog, name="github_feed"):
                 "action": issue_match.group(3).strip().lower(),
                 "issue_number": int(issue_match.group(2)),
                 "issue_title": issue_match.group(4).strip(),
-                "issue_url": url,
+                "issue_url": embed.url or "",
             }
 
         # ── Create: title contains "created" ──
-        create_match = re.match(
-            r"\[(.+)\] New (\w+) created: `?(.+?)`?$", title, re.IGNORECASE
-        )
+        create_match = "created" in title_lower and _CREATE_RE.match(title)
         if create_match:
             return {
                 "type": "create",
@@ -268,9 +286,7 @@ class GitHubFeed(commands.Cog, name="github_feed"):
             }
 
         # ── Delete: title contains "deleted" ──
-        delete_match = re.match(
-            r"\[(.+)\] (\w+) deleted: `?(.+?)`?$", title, re.IGNORECASE
-        )
+        delete_match = "deleted" in title_lower and _DELETE_RE.match(title)
         if delete_match:
             return {
                 "type": "delete",
@@ -282,10 +298,7 @@ class GitHubFeed(commands.Cog, name="github_feed"):
             }
 
         # ── Release: title contains "Release" ──
-        release_match = re.match(
-            r"\[(.+)\] (?:New )?[Rr]elease (.+?)(?:\s+(published|created|drafted))?$",
-            title,
-        )
+        release_match = "elease" in title and _RELEASE_RE.match(title)
         if release_match:
             return {
                 "type": "release",
@@ -294,7 +307,7 @@ class GitHubFeed(commands.Cog, name="github_feed"):
                 "sender": author_name,
                 "tag": release_match.group(2).strip(),
                 "release_name": release_match.group(2).strip(),
-                "release_url": url,
+                "release_url": embed.url or "",
                 "action": release_match.group(3) or "published",
             }
 
@@ -13,12 +13,14 @@ Schedule (fixed):
    6:00 PM UTC+8  (warnings at  5:30 PM,  5:50 PM)
 """
 
+import functools
 import os
-from collections import defaultdict
-from datetime import datetime, time, timezone, timedelta
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from itertools import chain, islice
 
 import discord
-from discord import app_commands
 from discord.ext import commands, tasks
 from discord.ext.commands import Context
 
@@ -36,20 +38,97 @@ REMINDER_TIMES = [
     time(hour=18, minute=0, tzinfo=TZ_UTC8),   # 6:00 PM UTC+8
 ]
 
-# Timezone display table for the embed
-TIMEZONE_TABLE = {
-    "UTC+8 (PH/SG/HK)": TZ_UTC8,
-    "UTC": ZoneInfo("UTC"),
-    "EST (US East)": ZoneInfo("America/New_York"),
-    "PST (US West)": ZoneInfo("America/Los_Angeles"),
-    "JST (Japan)": ZoneInfo("Asia/Tokyo"),
-    "GMT (London)": ZoneInfo("Europe/London"),
+# Minutes before each rebase that a message goes out (T-30, T-10, T-0)
+REMINDER_LEADS = (30, 10, 0)
+
+# (hour, minute) in UTC+8 -> (lead minutes, rebase time) for every scheduled send
+FIRE_SLOTS = {
+    divmod((rt.hour * 60 + rt.minute - lead) % 1440, 60): (lead, rt)
+    for rt in REMINDER_TIMES
+    for lead in REMINDER_LEADS
+}
+
+# Lead time -> (title template, message, color) of the warning sent that long before a rebase
+WARNINGS = {
+    30: (
+        "Rebase in 30 minutes ({} UTC+8)",
+        "Wrap up what you're working on. Push to `dev` within the next 20 minutes.",
+        0x0969DA,  # Blue
+    ),
+    10: (
+        "Push to dev NOW — Rebase in 10 minutes ({} UTC+8)",
+        "Push your changes to `dev` before the rebase.\n```git push origin dev```",
+        0xE8A317,  # Orange
+    ),
 }
 
+# Every time of day the reminder loop has to wake up for
+FIRE_TIMES = [time(hour=h, minute=m, tzinfo=TZ_UTC8) for h, m in FIRE_SLOTS]
+
+# How many minutes late a wake-up (gateway reconnect, blocked loop) may still send its slot
+FIRE_GRACE_MINUTES = 5
+
+# Timezone display table for the embed
+TIMEZONE_TABLE = (
+    ("UTC+8 (PH/SG/HK)", TZ_UTC8),
+    ("UTC", ZoneInfo("UTC")),
+    ("EST (US East)", ZoneInfo("America/New_York")),
+    ("PST (US West)", ZoneInfo("America/Los_Angeles")),
+    ("JST (Japan)", ZoneInfo("Asia/Tokyo")),
+    ("GMT (London)", ZoneInfo("Europe/London")),
+)
+
+
+@dataclass(slots=True)
+class _DevTally:
+    """Per-user push totals for the dev-branch section of the digest."""
+
+    commit_count: int = 0
+    commits: list[dict] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _BranchTally:
+    """Per-user push totals for the other-branches section of the digest."""
+
+    commit_count: int = 0
+    branches: set[str] = field(default_factory=set)
+
+
+def _clock(t: time | datetime) -> str:
+    """Format as `%I:%M %p` (e.g. 06:00 PM) without going through strftime."""
+    return f"{(t.hour - 1) % 12 + 1:02d}:{t.minute:02d} {'AM' if t.hour < 12 else 'PM'}"
+
+
+@functools.lru_cache(maxsize=2)
+def _schedule_grid(day: date) -> str:
+    """Render each rebase time on `day` in every display timezone (changes only with DST)."""
+    lines = []
+    for rt in REMINDER_TIMES:
+        dt = datetime.combine(day, rt)
+        tz_parts = " | ".join(f"{label}: **{_clock(dt.astimezone(tz))}**" for label, tz in TIMEZONE_TABLE)
+        lines.append(f"**{_clock(rt)} UTC+8**\n{tz_parts}")
+    return "\n\n".join(lines)
+
 
 class Reminders(commands.Cog, name="reminders"):
     def __init__(self, bot) -> None:
         self.bot = bot
+        channel_id = os.getenv("REMINDERS_CHANNEL_ID")
+        self._channel_id: int | None = int(channel_id) if channel_id else None
+        role_id = os.getenv("REBASE_PING_ROLE_ID")
+        self._ping = f"<@&{role_id}>" if role_id else "@here"
+        self._channel = None
+        # Warning embeds never change, so build one per warning slot up front
+        self._warning_embeds: dict[tuple[int, int], discord.Embed] = {}
+        for key, (lead, rt) in FIRE_SLOTS.items():
+            if lead in WARNINGS:
+                title, message, color = WARNINGS[lead]
+                self._warning_embeds[key] = discord.Embed(
+                    title=title.format(_clock(rt)), description=message, color=color
+                )
+        # ((feed cog id, buffer_version), event count, summary) of the last activity preview
+        self._preview_cache: tuple[tuple[int, int], int, str] | None = None
 
     async def cog_load(self) -> None:
         self.rebase_reminder.start()
@@ -58,47 +137,41 @@ class Reminders(commands.Cog, name="reminders"):
         self.rebase_reminder.cancel()
 
     def _get_channel(self):
-        channel_id = os.getenv("REMINDERS_CHANNEL_ID")
-        if not channel_id:
-            return None
-        return self.bot.get_channel(int(channel_id))
+        if self._channel is None and self._channel_id is not None:
+            self._channel = self.bot.get_channel(self._channel_id)
+        return self._channel
+
+    @commands.Cog.listener("on_guild_channel_delete")
+    async def forget_deleted_channel(self, channel: discord.abc.GuildChannel) -> None:
+        if channel.id == self._channel_id:
+            self._channel = None
 
     def _get_ping(self) -> str:
-        role_id = os.getenv("REBASE_PING_ROLE_ID")
-        if role_id:
-            return f"<@&{role_id}>"
-        return "@here"
+        return self._ping
 
-    @tasks.loop(minutes=1.0)
+    @tasks.loop(time=FIRE_TIMES)
     async def rebase_reminder(self) -> None:
-        """Check every minute for T-30 warning, T-10 push reminder, or T-0 rebase digest."""
-        now = datetime.now(TZ_UTC8)
-        current = now.hour * 60 + now.minute  # minutes since midnight
-
-        for rt in REMINDER_TIMES:
-            rebase_min = rt.hour * 60 + rt.minute
-            rebase_time_str = rt.strftime("%I:%M %p")
-
-            if current == rebase_min - 30:
-                await self._send_warning(
-                    title=f"Rebase in 30 minutes ({rebase_time_str} UTC+8)",
-                    message="Wrap up what you're working on. Push to `dev` within the next 20 minutes.",
-                    color=0x0969DA,  # Blue
-                )
-                break
-            elif current == rebase_min - 10:
-                await self._send_warning(
-                    title=f"Push to dev NOW — Rebase in 10 minutes ({rebase_time_str} UTC+8)",
-                    message=(
-                        "Push your changes to `dev` before the rebase.\n"
-                        "```git push origin dev```"
-                    ),
-                    color=0xE8A317,  # Orange
-                )
-                break
-            elif current == rebase_min:
-                await self._send_rebase_digest(now)
+        """Send the T-30 warning, T-10 push reminder, or T-0 rebase digest that is due."""
+        # Round to the minute in case the loop wakes a hair early, then walk back to the
+        # slot it was scheduled for in case it woke late
+        woke = (datetime.now(TZ_UTC8) + timedelta(seconds=30)).replace(second=0, microsecond=0)
+        for late in range(FIRE_GRACE_MINUTES + 1):
+            now = woke - timedelta(minutes=late)
+            key = (now.hour, now.minute)
+            if key in FIRE_SLOTS:
                 break
+        else:
+            self.bot.logger.warning(
+                f"Reminder loop woke at {woke:%H:%M} UTC+8 with no slot due; reminder skipped"
+            )
+            return
+        if late:
+            self.bot.logger.warning(f"Reminder loop woke {late} min late for the {now:%H:%M} slot")
+        warning = self._warning_embeds.get(key)
+        if warning is not None:
+            await self._send_warning(warning)
+        else:
+            await self._send_rebase_digest(now)
 
     @rebase_reminder.before_loop
     async def before_rebase_reminder(self) -> None:
@@ -107,107 +180,115 @@ class Reminders(commands.Cog, name="reminders"):
     def _build_timezone_string(self, utc8_time: datetime) -> str:
         """Build a multi-timezone display string for the embed."""
         lines = []
-        for label, tz in TIMEZONE_TABLE.items():
+        for label, tz in TIMEZONE_TABLE:
             converted = utc8_time.astimezone(tz)
             lines.append(f"**{label}:** {converted.strftime('%I:%M %p %b %d')}")
         return "\n".join(lines)
 
-    def _build_activity_summary(self, events: list[dict]) -> str:
+    def _build_activity_summary(self, events: Sequence[dict]) -> str:
         """Build a Design 1 (Clean & Compact) activity summary."""
         if not events:
             return ""
 
         # ── Group events ──
-        dev_pushes = defaultdict(lambda: {"commit_count": 0, "commits": []})
-        other_pushes = defaultdict(lambda: {"branches": set(), "commit_count": 0})
+        dev_pushes: dict[str, _DevTally] = {}
+        other_pushes: dict[str, _BranchTally] = {}
         prs = []
         branches_created = []
         branches_deleted = []
         issues_list = []
         releases = []
+        # Non-push events only need to be collected, so route them by type
+        buckets = {
+            "pull_request": prs,
+            "create": branches_created,
+            "delete": branches_deleted,
+            "issues": issues_list,
+            "release": releases,
+        }
 
         for e in events:
             etype = e["type"]
-            if etype == "push":
-                user = e.get("pusher", e["sender"])
-                branch = e.get("branch", "?")
-                if branch == "dev":
-                    dev_pushes[user]["commit_count"] += e.get("commit_count", 0)
-                    dev_pushes[user]["commits"].extend(e.get("commits", []))
-                else:
-                    other_pushes[user]["branches"].add(branch)
-                    other_pushes[user]["commit_count"] += e.get("commit_count", 0)
-            elif etype == "pull_request":
-                prs.append(e)
-            elif etype == "create":
-                branches_created.append(e)
-            elif etype == "delete":
-                branches_deleted.append(e)
-            elif etype == "issues":
-                issues_list.append(e)
-            elif etype == "release":
-                releases.append(e)
-
-        desc = ""
+            if etype != "push":
+                bucket = buckets.get(etype)
+                if bucket is not None:
+                    bucket.append(e)
+                continue
+            user = e.get("pusher", e["sender"])
+            branch = e.get("branch", "?")
+            if branch == "dev":
+                tally = dev_pushes.get(user)
+                if tally is None:
+                    tally = dev_pushes[user] = _DevTally()
+                tally.commits.extend(e.get("commits", ()))
+            else:
+                tally = other_pushes.get(user)
+                if tally is None:
+                    tally = other_pushes[user] = _BranchTally()
+                tally.branches.add(branch)
+            tally.commit_count += e.get("commit_count", 0)
+
+        parts: list[str] = []
 
         # ── Dev commits ──
         if dev_pushes:
-            total = sum(d["commit_count"] for d in dev_pushes.values())
-            desc += f"**Commits to `dev`** ({total})\n"
+            total = sum(d.commit_count for d in dev_pushes.values())
+            parts.append(f"**Commits to `dev`** ({total})\n")
             for user, data in dev_pushes.items():
-                desc += f"> **{user}** pushed {data['commit_count']}\n"
-                for c in data["commits"][:3]:
-                    desc += f"> `{c['sha']}` {c['message']}\n"
-                if len(data["commits"]) > 3:
-                    remaining = len(data["commits"]) - 3
-                    desc += f"> *... +{remaining} more*\n"
-            desc += "\n"
+                parts.append(f"> **{user}** pushed {data.commit_count}\n")
+                commits = data.commits
+                parts.extend(f"> `{c['sha']}` {c['message']}\n" for c in islice(commits, 3))
+                if len(commits) > 3:
+                    parts.append(f"> *... +{len(commits) - 3} more*\n")
+            parts.append("\n")
 
         # ── PRs ──
         if prs:
-            desc += f"**Pull Requests** ({len(prs)})\n"
+            parts.append(f"**Pull Requests** ({len(prs)})\n")
             for pr in prs:
                 action = pr.get("action", "")
                 if action == "closed" and pr.get("merged"):
                     action = "merged"
-                desc += f"> #{pr['pr_number']} {pr['pr_title']} (*{action}*)\n"
-            desc += "\n"
+                parts.append(f"> #{pr['pr_number']} {pr['pr_title']} (*{action}*)\n")
+            parts.append("\n")
 
         # ── Branches ──
         if branches_created or branches_deleted:
-            items = [f"+ `{b.get('ref', '?')}`" for b in branches_created]
-            items += [f"- `{b.get('ref', '?')}`" for b in branches_deleted]
-            desc += f"**Branches** {' '.join(items)}\n"
+            items = chain(
+                (f"+ `{b.get('ref', '?')}`" for b in branches_created),
+                (f"- `{b.get('ref', '?')}`" for b in branches_deleted),
+            )
+            parts.append(f"**Branches** {' '.join(items)}\n")
 
         # ── Issues ──
-        if issues_list:
-            for iss in issues_list:
-                desc += f"**Issue** #{iss['issue_number']} {iss['issue_title']} (*{iss.get('action', '')}*)\n"
+        parts.extend(
+            f"**Issue** #{iss['issue_number']} {iss['issue_title']} (*{iss.get('action', '')}*)\n"
+            for iss in issues_list
+        )
 
         # ── Releases ──
-        if releases:
-            for rel in releases:
-                desc += f"**Release** {rel.get('tag', '?')} (*{rel.get('action', '')}*)\n"
+        parts.extend(
+            f"**Release** {rel.get('tag', '?')} (*{rel.get('action', '')}*)\n"
+            for rel in releases
+        )
 
         # ── Other branches — small text ──
         if other_pushes:
-            total = sum(d["commit_count"] for d in other_pushes.values())
-            parts = []
-            for user, data in other_pushes.items():
-                branches_str = ", ".join(sorted(data["branches"]))
-                parts.append(f"{user}: {data['commit_count']} on {branches_str}")
-            joiner = " | ".join(parts)
-            desc += f"\n-# Other branches ({total} commits): {joiner}"
+            total = sum(d.commit_count for d in other_pushes.values())
+            joiner = " | ".join(
+                f"{user}: {data.commit_count} on {', '.join(sorted(data.branches))}"
+                for user, data in other_pushes.items()
+            )
+            parts.append(f"\n-# Other branches ({total} commits): {joiner}")
 
-        return desc
+        return "".join(parts)
 
-    async def _send_warning(self, title: str, message: str, color: int, suppress_ping: bool = False) -> None:
+    async def _send_warning(self, embed: discord.Embed, suppress_ping: bool = False) -> None:
         """Send a short warning embed to the reminders channel."""
         channel = self._get_channel()
         if not channel:
             return
         ping = None if suppress_ping else self._get_ping()
-        embed = discord.Embed(title=title, description=message, color=color)
         await channel.send(content=ping, embed=embed)
 
     async def _send_rebase_digest(self, now: datetime, suppress_ping: bool = False) -> None:
@@ -229,21 +310,14 @@ class Reminders(commands.Cog, name="reminders"):
 
         # ── Drain the event buffer from github_feed cog ──
         github_cog = self.bot.get_cog("github_feed")
-        events = []
-        if github_cog:
-            events = github_cog.drain_buffer()
+        events = github_cog.drain_buffer() if github_cog else None
 
         # ── Build Design 1 embed ──
-        desc = "```git fetch origin && git rebase origin/dev```\n"
-
-        activity = self._build_activity_summary(events)
-        if activity:
-            desc += activity
-        else:
-            desc += "*No activity since last digest.*"
+        activity = (events and self._build_activity_summary(events)) or "*No activity since last digest.*"
+        desc = f"```git fetch origin && git rebase origin/dev```\n{activity}"
 
         embed = discord.Embed(
-            title=f"Rebase — {session} ({now.strftime('%I:%M %p')} UTC+8)",
+            title=f"Rebase — {session} ({_clock(now)} UTC+8)",
             description=desc[:4096],
             color=color,
         )
@@ -260,17 +334,8 @@ class Reminders(commands.Cog, name="reminders"):
     )
     async def rebase_schedule(self, context: Context) -> None:
         """Show the current rebase reminder schedule with timezone conversions."""
-        now = datetime.now(TZ_UTC8)
-
-        lines = []
-        for rt in REMINDER_TIMES:
-            # Build a full datetime for today at this reminder time
-            dt = now.replace(hour=rt.hour, minute=rt.minute, second=0, microsecond=0)
-            tz_parts = []
-            for label, tz in TIMEZONE_TABLE.items():
-                converted = dt.astimezone(tz)
-                tz_parts.append(f"{label}: **{converted.strftime('%I:%M %p')}**")
-            lines.append(f"**{rt.strftime('%I:%M %p')} UTC+8**\n" + " | ".join(tz_parts))
+        # Today's (UTC+8) rebase times converted to every display timezone
+        grid = _schedule_grid(datetime.now(TZ_UTC8).date())
 
         channel = self._get_channel()
         github_cog = self.bot.get_cog("github_feed")
@@ -282,7 +347,7 @@ class Reminders(commands.Cog, name="reminders"):
                 f"**Channel:** {channel.mention if channel else 'Not configured'}\n"
                 f"**Ping:** {self._get_ping()}\n"
                 f"**Buffered events:** {buffered} (will be included in next digest)\n\n"
-                + "\n\n".join(lines)
+                + grid
             ),
             color=0x2EA44F,
         )
@@ -311,8 +376,17 @@ class Reminders(commands.Cog, name="reminders"):
             await context.send("GitHub feed cog not loaded.", ephemeral=True)
             return
 
-        events = github_cog.peek_buffer()
-        if not events:
+        # Reuse the last preview while the buffer hasn't changed
+        version = (id(github_cog), github_cog.buffer_version)
+        if self._preview_cache is not None and self._preview_cache[0] == version:
+            _, count, activity = self._preview_cache
+        else:
+            events = github_cog.peek_buffer()
+            count = len(events)
+            activity = self._build_activity_summary(events)
+            self._preview_cache = (version, count, activity)
+
+        if not count:
             embed = discord.Embed(
                 title="Activity Preview",
                 description="No events buffered since last digest.",
@@ -321,9 +395,8 @@ class Reminders(commands.Cog, name="reminders"):
             await context.send(embed=embed, ephemeral=True)
             return
 
-        activity = self._build_activity_summary(events)
         embed = discord.Embed(
-            title=f"Activity Preview — {len(events)} events buffered",
+            title=f"Activity Preview — {count} events buffered",
             description=activity or "No events.",
             color=0x0969DA,
         )
@@ -3,326 +3,367 @@ Temporary test cog to preview digest designs and inject mock data.
 Delete this file once you're done testing.
 """
 
-from collections import defaultdict
 from datetime import datetime, timezone, timedelta
+from itertools import chain, islice
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 from discord.ext.commands import Context
 
-
-# Mock events based on real AdHub activity
-MOCK_EVENTS = [
-    {
-        "type": "push",
-        "timestamp": datetime.now(timezone.utc) - timedelta(hours=5),
-        "repo": "AdhubOrg/adhub",
-        "sender": "ferret9",
-        "branch": "staging",
-        "pusher": "ferret9",
-        "commit_count": 1,
-        "commits": [
-            {
-                "sha": "085e45a",
-                "message": "fix(deploy): add uuid to production dependencies",
-                "url": "https://github.com/AdhubOrg/adhub/commit/085e45a",
-            }
-        ],
-        "compare_url": "https://github.com/AdhubOrg/adhub/compare/staging",
-    },
-    {
-        "type": "push",
-        "timestamp": datetime.now(timezone.utc) - timedelta(hours=4),
-        "repo": "AdhubOrg/adhub",
-        "sender": "ferret9",
-        "branch": "staging",
-        "pusher": "ferret9",
-        "commit_count": 1,
-        "commits": [
-            {
-                "sha": "4f8ae12",
-                "message": "fix(deploy): always export Express router from index",
-                "url": "https://github.com/AdhubOrg/adhub/commit/4f8ae12",
-            }
-        ],
-        "compare_url": "https://github.com/AdhubOrg/adhub/compare/staging",
-    },
-    {
-        "type": "push",
-        "timestamp": datetime.now(timezone.utc) - timedelta(hours=1),
-        "repo": "AdhubOrg/adhub",
-        "sender": "luceinrock",
-        "branch": "dev",
-        "pusher": "luceinrock",
-        "commit_count": 3,
-        "commits": [
-            {
-                "sha": "2d758f1",
-                "message": "fix(identity): add address_hash to unique constraint",
-                "url": "https://github.com/AdhubOrg/adhub/commit/2d758f1",
-            },
-            {
-                "sha": "a1b2c3d",
-                "message": "feat(auth): implement JWT refresh token rotation",
-                "url": "https://github.com/AdhubOrg/adhub/commit/a1b2c3d",
-            },
-            {
-                "sha": "e4f5g6h",
-                "message": "test(auth): add refresh token edge cases",
-                "url": "https://github.com/AdhubOrg/adhub/commit/e4f5g6h",
-            },
-        ],
-        "compare_url": "https://github.com/AdhubOrg/adhub/compare/dev",
-    },
-    {
-        "type": "push",
-        "timestamp": datetime.now(timezone.utc) - timedelta(minutes=30),
-        "repo": "AdhubOrg/adhub",
-        "sender": "global-angelo",
-        "branch": "dev",
-        "pusher": "global-angelo",
-        "commit_count": 2,
-        "commits": [
-            {
-                "sha": "4c88d54",
-                "message": "feat(server): register sprint 10-11 api routes",
-                "url": "https://github.com/AdhubOrg/adhub/commit/4c88d54",
-            },
-            {
-                "sha": "fb11adc",
-                "message": "chore(env): update dev environment variables",
-                "url": "https://github.com/AdhubOrg/adhub/commit/fb11adc",
-            },
-        ],
-        "compare_url": "https://github.com/AdhubOrg/adhub/compare/dev",
-    },
-    {
-        "type": "pull_request",
-        "timestamp": datetime.now(timezone.utc) - timedelta(hours=2),
-        "repo": "AdhubOrg/adhub",
-        "sender": "ferret9",
-        "action": "opened",
-        "pr_number": 42,
-        "pr_title": "fix(deploy): production dependency cleanup",
-        "pr_url": "https://github.com/AdhubOrg/adhub/pull/42",
-        "head": "staging",
-        "base": "main",
-        "merged": False,
-        "additions": 15,
-        "deletions": 3,
-        "changed_files": 2,
-    },
-    {
-        "type": "create",
-        "timestamp": datetime.now(timezone.utc) - timedelta(hours=6),
-        "repo": "AdhubOrg/adhub",
-        "sender": "luceinrock",
-        "ref_type": "branch",
-        "ref": "fix/identity-constraint",
-    },
-    {
-        "type": "issues",
-        "timestamp": datetime.now(timezone.utc) - timedelta(hours=3),
-        "repo": "AdhubOrg/adhub",
-        "sender": "ferret9",
-        "action": "opened",
-        "issue_number": 18,
-        "issue_title": "UUID missing from production build",
-        "issue_url": "https://github.com/AdhubOrg/adhub/issues/18",
-    },
-]
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo
+
+# UTC+8 timezone
+TZ_UTC8 = ZoneInfo("Asia/Manila")
+
+# Static text shared by every design
+REBASE_FENCE = "```git fetch origin && git rebase origin/dev```"
+DIGEST_FOOTER = "/rebase-now \u2022 /rebase-schedule \u2022 /activity-preview"
+# (session label, color) indexed by whether it's the midday rebase
+SESSIONS = (("End of Day", 0xCF222E), ("Midday", 0xE8A317))
+
+
+def _build_mock_events(now: datetime) -> list[dict]:
+    """Mock events based on real AdHub activity, timestamped relative to `now`."""
+    return [
+        {
+            "type": "push",
+            "timestamp": now - timedelta(hours=5),
+            "repo": "AdhubOrg/adhub",
+            "sender": "ferret9",
+            "branch": "staging",
+            "pusher": "ferret9",
+            "commit_count": 1,
+            "commits": [
+                {
+                    "sha": "085e45a",
+                    "message": "fix(deploy): add uuid to production dependencies",
+                    "url": "https://github.com/AdhubOrg/adhub/commit/085e45a",
+                }
+            ],
+            "compare_url": "https://github.com/AdhubOrg/adhub/compare/staging",
+        },
+        {
+            "type": "push",
+            "timestamp": now - timedelta(hours=4),
+            "repo": "AdhubOrg/adhub",
+            "sender": "ferret9",
+            "branch": "staging",
+            "pusher": "ferret9",
+            "commit_count": 1,
+            "commits": [
+                {
+                    "sha": "4f8ae12",
+                    "message": "fix(deploy): always export Express router from index",
+                    "url": "https://github.com/AdhubOrg/adhub/commit/4f8ae12",
+                }
+            ],
+            "compare_url": "https://github.com/AdhubOrg/adhub/compare/staging",
+        },
+        {
+            "type": "push",
+            "timestamp": now - timedelta(hours=1),
+            "repo": "AdhubOrg/adhub",
+            "sender": "luceinrock",
+            "branch": "dev",
+            "pusher": "luceinrock",
+            "commit_count": 3,
+            "commits": [
+                {
+                    "sha": "2d758f1",
+                    "message": "fix(identity): add address_hash to unique constraint",
+                    "url": "https://github.com/AdhubOrg/adhub/commit/2d758f1",
+                },
+                {
+                    "sha": "a1b2c3d",
+                    "message": "feat(auth): implement JWT refresh token rotation",
+                    "url": "https://github.com/AdhubOrg/adhub/commit/a1b2c3d",
+                },
+                {
+                    "sha": "e4f5g6h",
+                    "message": "test(auth): add refresh token edge cases",
+                    "url": "https://github.com/AdhubOrg/adhub/commit/e4f5g6h",
+                },
+            ],
+            "compare_url": "https://github.com/AdhubOrg/adhub/compare/dev",
+        },
+        {
+            "type": "push",
+            "timestamp": now - timedelta(minutes=30),
+            "repo": "AdhubOrg/adhub",
+            "sender": "global-angelo",
+            "branch": "dev",
+            "pusher": "global-angelo",
+            "commit_count": 2,
+            "commits": [
+                {
+                    "sha": "4c88d54",
+                    "message": "feat(server): register sprint 10-11 api routes",
+                    "url": "https://github.com/AdhubOrg/adhub/commit/4c88d54",
+                },
+                {
+                    "sha": "fb11adc",
+                    "message": "chore(env): update dev environment variables",
+                    "url": "https://github.com/AdhubOrg/adhub/commit/fb11adc",
+                },
+            ],
+            "compare_url": "https://github.com/AdhubOrg/adhub/compare/dev",
+        },
+        {
+            "type": "pull_request",
+            "timestamp": now - timedelta(hours=2),
+            "repo": "AdhubOrg/adhub",
+            "sender": "ferret9",
+            "action": "opened",
+            "pr_number": 42,
+            "pr_title": "fix(deploy): production dependency cleanup",
+            "pr_url": "https://github.com/AdhubOrg/adhub/pull/42",
+            "head": "staging",
+            "base": "main",
+            "merged": False,
+            "additions": 15,
+            "deletions": 3,
+            "changed_files": 2,
+        },
+        {
+            "type": "create",
+            "timestamp": now - timedelta(hours=6),
+            "repo": "AdhubOrg/adhub",
+            "sender": "luceinrock",
+            "ref_type": "branch",
+            "ref": "fix/identity-constraint",
+        },
+        {
+            "type": "issues",
+            "timestamp": now - timedelta(hours=3),
+            "repo": "AdhubOrg/adhub",
+            "sender": "ferret9",
+            "action": "opened",
+            "issue_number": 18,
+            "issue_title": "UUID missing from production build",
+            "issue_url": "https://github.com/AdhubOrg/adhub/issues/18",
+        },
+    ]
 
 
 def _group_events(events):
     """Shared event grouping logic for all designs."""
-    dev_pushes = defaultdict(lambda: {"commit_count": 0, "commits": []})
-    other_pushes = defaultdict(lambda: {"branches": set(), "commit_count": 0})
+    if not events:
+        # Nothing to group; the designs render their own "no activity" layout from these
+        return {}, {}, (), (), (), (), 0, 0
+
+    dev_pushes = {}
+    other_pushes = {}
     prs = []
     branches_created = []
     branches_deleted = []
     issues_list = []
+    dev_total = 0
+    other_total = 0
+    # Non-push events only need to be collected, so route them by type
+    buckets = {
+        "create": branches_created,
+        "delete": branches_deleted,
+        "issues": issues_list,
+    }
 
     for e in events:
         etype = e["type"]
         if etype == "push":
             user = e.get("pusher", e["sender"])
             branch = e.get("branch", "?")
+            count = e.get("commit_count", 0)
             if branch == "dev":
-                dev_pushes[user]["commit_count"] += e.get("commit_count", 0)
-                dev_pushes[user]["commits"].extend(e.get("commits", []))
+                data = dev_pushes.get(user)
+                if data is None:
+                    dev_pushes[user] = {"commit_count": count, "commits": list(e.get("commits", ()))}
+                else:
+                    data["commit_count"] += count
+                    data["commits"].extend(e.get("commits", ()))
+                dev_total += count
             else:
-                other_pushes[user]["branches"].add(branch)
-                other_pushes[user]["commit_count"] += e.get("commit_count", 0)
+                data = other_pushes.get(user)
+                if data is None:
+                    other_pushes[user] = {"branches": {branch}, "commit_count": count}
+                else:
+                    data["branches"].add(branch)
+                    data["commit_count"] += count
+                other_total += count
         elif etype == "pull_request":
-            prs.append(e)
-        elif etype == "create":
-            branches_created.append(e)
-        elif etype == "delete":
-            branches_deleted.append(e)
-        elif etype == "issues":
-            issues_list.append(e)
+            # Show merged PRs as "merged" rather than "closed" in every design
+            action = e.get("action", "")
+            if action == "closed" and e.get("merged"):
+                action = "merged"
+            prs.append((e, action))
+        else:
+            bucket = buckets.get(etype)
+            if bucket is not None:
+                bucket.append(e)
 
-    return dev_pushes, other_pushes, prs, branches_created, branches_deleted, issues_list
+    # Every design lists a user's other branches the same way, so render that once
+    for data in other_pushes.values():
+        data["branches_label"] = ", ".join(sorted(data.pop("branches")))
+
+    return (
+        dev_pushes, other_pushes, prs, branches_created, branches_deleted, issues_list,
+        dev_total, other_total,
+    )
 
 
-def build_design_1(events, now):
+def build_design_1(events, now, now_str=None):
     """Design 1: Clean & Compact — single embed, block layout."""
-    dev_pushes, other_pushes, prs, branches_created, branches_deleted, issues_list = _group_events(events)
+    (
+        dev_pushes, other_pushes, prs, branches_created, branches_deleted, issues_list,
+        dev_total, other_total,
+    ) = _group_events(events)
 
-    session = "Midday" if now.hour == 12 else "End of Day"
-    color = 0xE8A317 if now.hour == 12 else 0xCF222E
+    session, color = SESSIONS[now.hour == 12]
+    now_str = now_str or now.strftime("%I:%M %p")
 
-    desc = "```git fetch origin && git rebase origin/dev```\n"
+    parts = [REBASE_FENCE, "\n"]
 
     # Dev commits
     if dev_pushes:
-        total = sum(d["commit_count"] for d in dev_pushes.values())
-        desc += f"**Commits to `dev`** ({total})\n"
+        parts.append(f"**Commits to `dev`** ({dev_total})\n")
         for user, data in dev_pushes.items():
-            desc += f"> **{user}** pushed {data['commit_count']}\n"
-            for c in data["commits"][:3]:
-                desc += f"> `{c['sha']}` {c['message']}\n"
-            if len(data["commits"]) > 3:
-                desc += f"> *... +{len(data['commits']) - 3} more*\n"
-        desc += "\n"
+            parts.append(f"> **{user}** pushed {data['commit_count']}\n")
+            commits = data["commits"]
+            parts.extend(f"> `{c['sha']}` {c['message']}\n" for c in islice(commits, 3))
+            if len(commits) > 3:
+                parts.append(f"> *... +{len(commits) - 3} more*\n")
+        parts.append("\n")
 
     # PRs
     if prs:
-        desc += f"**Pull Requests** ({len(prs)})\n"
-        for pr in prs:
-            action = pr.get("action", "")
-            if action == "closed" and pr.get("merged"):
-                action = "merged"
-            desc += f"> #{pr['pr_number']} {pr['pr_title']} (*{action}*)\n"
-        desc += "\n"
+        parts.append(f"**Pull Requests** ({len(prs)})\n")
+        for pr, action in prs:
+            parts.append(f"> #{pr['pr_number']} {pr['pr_title']} (*{action}*)\n")
+        parts.append("\n")
 
     # Branches + Issues on one line each
     if branches_created or branches_deleted:
-        items = [f"+ `{b.get('ref', '?')}`" for b in branches_created]
-        items += [f"- `{b.get('ref', '?')}`" for b in branches_deleted]
-        desc += f"**Branches** {' '.join(items)}\n"
+        items = chain(
+            (f"+ `{b.get('ref', '?')}`" for b in branches_created),
+            (f"- `{b.get('ref', '?')}`" for b in branches_deleted),
+        )
+        parts.append(f"**Branches** {' '.join(items)}\n")
 
-    if issues_list:
-        for iss in issues_list:
-            desc += f"**Issue** #{iss['issue_number']} {iss['issue_title']} (*{iss.get('action', '')}*)\n"
+    parts.extend(
+        f"**Issue** #{iss['issue_number']} {iss['issue_title']} (*{iss.get('action', '')}*)\n"
+        for iss in issues_list
+    )
 
     # Other branches — small text
     if other_pushes:
-        total = sum(d["commit_count"] for d in other_pushes.values())
-        parts = []
-        for user, data in other_pushes.items():
-            branches_str = ", ".join(sorted(data["branches"]))
-            parts.append(f"{user}: {data['commit_count']} on {branches_str}")
-        desc += f"\n-# Other branches ({total} commits): {' | '.join(parts)}"
+        others = " | ".join(
+            f"{user}: {data['commit_count']} on {data['branches_label']}"
+            for user, data in other_pushes.items()
+        )
+        parts.append(f"\n-# Other branches ({other_total} commits): {others}")
 
     if not events:
-        desc += "*No activity since last digest.*"
+        parts.append("*No activity since last digest.*")
 
     embed = discord.Embed(
-        title=f"Rebase — {session} ({now.strftime('%I:%M %p')} UTC+8)",
-        description=desc[:4096],
+        title=f"Rebase — {session} ({now_str} UTC+8)",
+        description="".join(parts)[:4096],
         color=color,
     )
-    embed.set_footer(text="/rebase-now \u2022 /rebase-schedule \u2022 /activity-preview")
+    embed.set_footer(text=DIGEST_FOOTER)
     embed.timestamp = now
     return [embed]
 
 
-def build_design_2(events, now):
+def build_design_2(events, now, now_str=None):
     """Design 2: Field Cards — uses embed fields for clean grouping."""
-    dev_pushes, other_pushes, prs, branches_created, branches_deleted, issues_list = _group_events(events)
+    (
+        dev_pushes, other_pushes, prs, branches_created, branches_deleted, issues_list,
+        dev_total, other_total,
+    ) = _group_events(events)
 
-    session = "Midday" if now.hour == 12 else "End of Day"
-    color = 0xE8A317 if now.hour == 12 else 0xCF222E
+    session, color = SESSIONS[now.hour == 12]
+    now_str = now_str or now.strftime("%I:%M %p")
 
     embed = discord.Embed(
         title=f"Rebase — {session}",
         description=(
-            f"**{now.strftime('%I:%M %p')} UTC+8** \u2022 "
-            f"Sync your branch with `dev`\n"
-            f"```git fetch origin && git rebase origin/dev```"
+            f"**{now_str} UTC+8** \u2022 "
+            f"Sync your branch with `dev`\n{REBASE_FENCE}"
         ),
         color=color,
     )
 
     # Dev commits field
     if dev_pushes:
-        total = sum(d["commit_count"] for d in dev_pushes.values())
-        val = ""
+        lines = []
         for user, data in dev_pushes.items():
-            val += f"**{user}** \u2014 {data['commit_count']}\n"
-            for c in data["commits"][:3]:
-                val += f"`{c['sha']}` {c['message']}\n"
-            if len(data["commits"]) > 3:
-                val += f"*+{len(data['commits']) - 3} more*\n"
+            lines.append(f"**{user}** \u2014 {data['commit_count']}\n")
+            commits = data["commits"]
+            lines.extend(f"`{c['sha']}` {c['message']}\n" for c in islice(commits, 3))
+            if len(commits) > 3:
+                lines.append(f"*+{len(commits) - 3} more*\n")
         embed.add_field(
-            name=f"\U0001f4e6 Commits to dev ({total})",
-            value=val[:1024],
+            name=f"\U0001f4e6 Commits to dev ({dev_total})",
+            value="".join(lines)[:1024],
             inline=False,
         )
 
     # PRs field
     if prs:
-        val = ""
-        for pr in prs:
-            action = pr.get("action", "")
-            if action == "closed" and pr.get("merged"):
-                action = "merged"
-            val += f"#{pr['pr_number']} {pr['pr_title']} (*{action}*)\n"
+        lines = []
+        for pr, action in prs:
+            lines.append(f"#{pr['pr_number']} {pr['pr_title']} (*{action}*)\n")
         embed.add_field(
             name=f"\U0001f501 Pull Requests ({len(prs)})",
-            value=val[:1024],
+            value="".join(lines)[:1024],
             inline=False,
         )
 
     # Branches + Issues as inline fields
     if branches_created or branches_deleted:
-        val = ""
-        for b in branches_created:
-            val += f"\u2795 `{b.get('ref', '?')}`\n"
-        for b in branches_deleted:
-            val += f"\u2796 `{b.get('ref', '?')}`\n"
-        embed.add_field(name="\U0001f33f Branches", value=val[:1024], inline=True)
+        lines = [f"\u2795 `{b.get('ref', '?')}`\n" for b in branches_created]
+        lines.extend(f"\u2796 `{b.get('ref', '?')}`\n" for b in branches_deleted)
+        embed.add_field(name="\U0001f33f Branches", value="".join(lines)[:1024], inline=True)
 
     if issues_list:
-        val = ""
-        for iss in issues_list:
-            val += f"#{iss['issue_number']} {iss['issue_title']}\n"
-        embed.add_field(name="\U0001f41b Issues", value=val[:1024], inline=True)
+        value = "".join(f"#{iss['issue_number']} {iss['issue_title']}\n" for iss in issues_list)
+        embed.add_field(name="\U0001f41b Issues", value=value[:1024], inline=True)
 
     # Other branches — footer-style
     if other_pushes:
-        total = sum(d["commit_count"] for d in other_pushes.values())
-        parts = []
-        for user, data in other_pushes.items():
-            branches_str = ", ".join(sorted(data["branches"]))
-            parts.append(f"{user}: {data['commit_count']} on {branches_str}")
+        others = " | ".join(
+            f"{user}: {data['commit_count']} on {data['branches_label']}"
+            for user, data in other_pushes.items()
+        )
         embed.add_field(
             name="Other branches",
-            value=f"-# {' | '.join(parts)} ({total} commits)",
+            value=f"-# {others} ({other_total} commits)",
             inline=False,
         )
 
     if not events:
         embed.add_field(name="\u200b", value="*No activity since last digest.*", inline=False)
 
-    embed.set_footer(text="/rebase-now \u2022 /rebase-schedule \u2022 /activity-preview")
+    embed.set_footer(text=DIGEST_FOOTER)
     embed.timestamp = now
     return [embed]
 
 
-def build_design_3(events, now):
+def build_design_3(events, now, now_str=None):
     """Design 3: Bulletin Board — header embed + activity embed, visual separators."""
-    dev_pushes, other_pushes, prs, branches_created, branches_deleted, issues_list = _group_events(events)
+    (
+        dev_pushes, other_pushes, prs, branches_created, branches_deleted, issues_list,
+        dev_total, other_total,
+    ) = _group_events(events)
 
-    session = "Midday" if now.hour == 12 else "End of Day"
-    color = 0xE8A317 if now.hour == 12 else 0xCF222E
+    session, color = SESSIONS[now.hour == 12]
+    now_str = now_str or now.strftime("%I:%M %p")
     accent = 0x2EA44F
 
     # Header embed
-    dev_total = sum(d["commit_count"] for d in dev_pushes.values())
-    other_total = sum(d["commit_count"] for d in other_pushes.values())
     stats = []
     if dev_total:
         stats.append(f"\U0001f4e6 {dev_total} commits")
@@ -337,67 +378,62 @@ def build_design_3(events, now):
     header = discord.Embed(
         title=f"\U0001f514 Rebase — {session}",
         description=(
-            f"**{now.strftime('%I:%M %p')} UTC+8**\n\n"
-            f"{stats_line}\n\n"
-            f"```git fetch origin && git rebase origin/dev```"
+            f"**{now_str} UTC+8**\n\n"
+            f"{stats_line}\n\n{REBASE_FENCE}"
         ),
         color=color,
     )
     header.timestamp = now
 
     if not events:
-        header.set_footer(text="/rebase-now \u2022 /rebase-schedule \u2022 /activity-preview")
+        header.set_footer(text=DIGEST_FOOTER)
         return [header]
 
     # Activity embed
-    desc = ""
+    parts = []
 
     if dev_pushes:
-        desc += "\U0001f7e2 **dev**\n"
+        parts.append("\U0001f7e2 **dev**\n")
         for user, data in dev_pushes.items():
-            desc += f"\u2514 **{user}** ({data['commit_count']} commits)\n"
-            for c in data["commits"][:3]:
-                desc += f"  \u2502 `{c['sha']}` {c['message']}\n"
-            if len(data["commits"]) > 3:
-                desc += f"  \u2502 *+{len(data['commits']) - 3} more*\n"
-        desc += "\n"
+            parts.append(f"\u2514 **{user}** ({data['commit_count']} commits)\n")
+            commits = data["commits"]
+            parts.extend(f"  \u2502 `{c['sha']}` {c['message']}\n" for c in islice(commits, 3))
+            if len(commits) > 3:
+                parts.append(f"  \u2502 *+{len(commits) - 3} more*\n")
+        parts.append("\n")
 
     if prs:
-        desc += "\U0001f7e3 **Pull Requests**\n"
-        for pr in prs:
-            action = pr.get("action", "")
-            if action == "closed" and pr.get("merged"):
-                action = "merged"
-            desc += f"\u2514 #{pr['pr_number']} {pr['pr_title']} \u2014 *{action}*\n"
-        desc += "\n"
+        parts.append("\U0001f7e3 **Pull Requests**\n")
+        for pr, action in prs:
+            parts.append(f"\u2514 #{pr['pr_number']} {pr['pr_title']} \u2014 *{action}*\n")
+        parts.append("\n")
 
     if branches_created or branches_deleted:
-        desc += "\U0001f535 **Branches**\n"
-        for b in branches_created:
-            desc += f"\u2514 \u2795 `{b.get('ref', '?')}` by {b['sender']}\n"
-        for b in branches_deleted:
-            desc += f"\u2514 \u2796 `{b.get('ref', '?')}` by {b['sender']}\n"
-        desc += "\n"
+        parts.append("\U0001f535 **Branches**\n")
+        parts.extend(f"\u2514 \u2795 `{b.get('ref', '?')}` by {b['sender']}\n" for b in branches_created)
+        parts.extend(f"\u2514 \u2796 `{b.get('ref', '?')}` by {b['sender']}\n" for b in branches_deleted)
+        parts.append("\n")
 
     if issues_list:
-        desc += "\U0001f7e0 **Issues**\n"
-        for iss in issues_list:
-            desc += f"\u2514 #{iss['issue_number']} {iss['issue_title']} \u2014 *{iss.get('action', '')}*\n"
-        desc += "\n"
+        parts.append("\U0001f7e0 **Issues**\n")
+        parts.extend(
+            f"\u2514 #{iss['issue_number']} {iss['issue_title']} \u2014 *{iss.get('action', '')}*\n"
+            for iss in issues_list
+        )
+        parts.append("\n")
 
     if other_pushes:
-        total = sum(d["commit_count"] for d in other_pushes.values())
-        parts = []
-        for user, data in other_pushes.items():
-            branches_str = ", ".join(sorted(data["branches"]))
-            parts.append(f"{user}: {data['commit_count']} on {branches_str}")
-        desc += f"-# Other branches: {' | '.join(parts)} ({total} commits)"
+        others = " | ".join(
+            f"{user}: {data['commit_count']} on {data['branches_label']}"
+            for user, data in other_pushes.items()
+        )
+        parts.append(f"-# Other branches: {others} ({other_total} commits)")
 
     activity = discord.Embed(
-        description=desc[:4096],
+        description="".join(parts)[:4096],
         color=accent,
     )
-    activity.set_footer(text="/rebase-now \u2022 /rebase-schedule \u2022 /activity-preview")
+    activity.set_footer(text=DIGEST_FOOTER)
     return [header, activity]
 
 
@@ -424,21 +460,17 @@ class TestDigest(commands.Cog, name="test_digest"):
             await context.send("GitHub feed cog is not loaded.", ephemeral=True)
             return
 
-        github_cog.event_buffer.extend(MOCK_EVENTS)
+        mock_events = _build_mock_events(datetime.now(timezone.utc))
+        github_cog.buffer_events(mock_events)
 
         await context.send(
-            f"Injected **{len(MOCK_EVENTS)}** mock events. Triggering digest now...",
+            f"Injected **{len(mock_events)}** mock events. Triggering digest now...",
             ephemeral=True,
         )
 
         reminders_cog = self.bot.get_cog("reminders")
         if reminders_cog:
-            from datetime import datetime
-            try:
-                from zoneinfo import ZoneInfo
-            except ImportError:
-                from backports.zoneinfo import ZoneInfo
-            now = datetime.now(ZoneInfo("Asia/Manila"))
+            now = datetime.now(TZ_UTC8)
             await reminders_cog._send_rebase_digest(now, suppress_ping=True)
         else:
             await context.send("Reminders cog is not loaded.", ephemeral=True)
@@ -455,18 +487,13 @@ class TestDigest(commands.Cog, name="test_digest"):
     ])
     async def test_design(self, context: Context, design: int) -> None:
         """Preview a specific digest design."""
-        try:
-            from zoneinfo import ZoneInfo
-        except ImportError:
-            from backports.zoneinfo import ZoneInfo
-
-        now = datetime.now(ZoneInfo("Asia/Manila"))
+        now = datetime.now(TZ_UTC8)
         builder = DESIGNS.get(design)
         if not builder:
             await context.send("Pick 1, 2, or 3.", ephemeral=True)
             return
 
-        embeds = builder(MOCK_EVENTS, now)
+        embeds = builder(_build_mock_events(now), now, now.strftime("%I:%M %p"))
         await context.send(
             content=f"**Design {design} preview:**",
             embeds=embeds,